@@ -6,21 +6,46 @@ This script shows how to use the gh-oauth-helper CLI commands
 for different OAuth operations.
 """
 
+import atexit
+import json
 import subprocess
 import sys
 import os
 
+# Long-lived CLI worker shared by every run_cli_command() call
+_worker = None
+
+
+def _get_worker():
+    """Start the CLI worker process on first use and reuse it afterwards."""
+    global _worker
+    if _worker is None or _worker.poll() is not None:
+        _worker = subprocess.Popen(
+            [sys.executable, "-m", "gh_oauth_helper.cli", "--worker"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+        atexit.register(_worker.stdin.close)
+    return _worker
+
 
 def run_cli_command(command_args):
-    """Run a CLI command and capture output."""
-    cmd = [sys.executable, "-m", "gh_oauth_helper.cli"] + command_args
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        return result.stdout
-    except subprocess.CalledProcessError as e:
-        print(f"Error running command: {e}")
-        print(f"stderr: {e.stderr}")
+    """Run a CLI command in the persistent worker and capture output."""
+    worker = _get_worker()
+    worker.stdin.write(json.dumps(command_args).encode("utf-8") + b"\n")
+    worker.stdin.flush()
+    line = worker.stdout.readline()
+    if not line:
+        print("Error running command: CLI worker exited unexpectedly")
+        return None
+
+    # Binary pipes: decode each response once rather than per stream read
+    result = json.loads(line.decode("utf-8", "replace"))
+    if result["returncode"] != 0:
+        print(f"Error running command: exit status {result['returncode']}")
+        print(f"stderr: {result['stderr']}")
         return None
+    return result["stdout"]
 
 
 def main():
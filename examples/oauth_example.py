@@ -12,6 +12,7 @@ Set your GitHub OAuth app credentials as environment variables:
 Or pass them directly to the functions.
 """
 
+import functools
 import os
 import sys
 
@@ -27,6 +28,12 @@ from gh_oauth_helper import (
 )
 
 
+@functools.lru_cache(maxsize=None)
+def getenv(name, default=None):
+    """Read an environment variable once; later changes are not picked up."""
+    return os.getenv(name, default)
+
+
 def example_basic_usage():
     """Example using the basic convenience functions."""
     print("=== Basic Usage Example ===")
@@ -64,9 +71,9 @@ def example_class_usage():
     try:
         # Create OAuth helper with explicit credentials (or use environment variables)
         oauth = GitHubOAuth(
-            client_id=os.getenv("GITHUB_CLIENT_ID"),
-            client_secret=os.getenv("GITHUB_CLIENT_SECRET"),
-            redirect_uri=os.getenv("GITHUB_REDIRECT_URI", "http://localhost:8080/callback")
+            client_id=getenv("GITHUB_CLIENT_ID"),
+            client_secret=getenv("GITHUB_CLIENT_SECRET"),
+            redirect_uri=getenv("GITHUB_REDIRECT_URI", "http://localhost:8080/callback")
         )
         
         # Generate authorization URL with custom scopes
@@ -97,7 +104,7 @@ def example_complete_flow_simulation():
     print("\n=== Complete Flow Simulation ===")
     
     # Check if we have credentials
-    if not os.getenv("GITHUB_CLIENT_ID") or not os.getenv("GITHUB_CLIENT_SECRET"):
+    if not getenv("GITHUB_CLIENT_ID") or not getenv("GITHUB_CLIENT_SECRET"):
         print("⚠️  Set GITHUB_CLIENT_ID and GITHUB_CLIENT_SECRET environment variables to run this example")
         return False
     
@@ -140,7 +147,7 @@ def main():
     
     # Check for environment variables
     env_vars = ["GITHUB_CLIENT_ID", "GITHUB_CLIENT_SECRET"]
-    missing_vars = [var for var in env_vars if not os.getenv(var)]
+    missing_vars = [var for var in env_vars if not getenv(var)]
     
     if missing_vars:
         print("⚠️  Missing environment variables:")
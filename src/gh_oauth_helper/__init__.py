@@ -10,16 +10,42 @@ __author__ = "Jonathan Marien"
 __email__ = "jon@chron0.tech"
 __description__ = "A Python helper package for Local GitHub OAuth authentication"
 
-# Import main classes/functions
-from .core import (
-    GitHubOAuth,
-    GitHubOAuthError,
-    create_oauth_helper,
-    start_auth_flow,
-    complete_auth_flow,
-    verify_token,
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .core import (
+        GitHubOAuth,
+        GitHubOAuthError,
+        create_oauth_helper,
+        start_auth_flow,
+        complete_auth_flow,
+        verify_token,
+    )
+
+# Main classes/functions, imported from .core on first access so that the CLI
+# does not load requests for --help or argument errors
+_CORE_EXPORTS = (
+    "GitHubOAuth",
+    "GitHubOAuthError",
+    "create_oauth_helper",
+    "start_auth_flow",
+    "complete_auth_flow",
+    "verify_token",
 )
 
+
+def __getattr__(name: str) -> Any:
+    if name in _CORE_EXPORTS:
+        from . import core
+
+        return getattr(core, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_CORE_EXPORTS))
+
+
 __all__ = [
     "__version__",
     "__author__",
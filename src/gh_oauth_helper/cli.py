@@ -6,11 +6,14 @@ supporting authorization URL generation, token exchange, and token management.
 """
 
 import argparse
+import functools
+import io
+import os
 import sys
-import json
-import webbrowser
+import types
+from contextlib import redirect_stderr, redirect_stdout
 from datetime import datetime
-from typing import Dict, Any
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 from urllib.parse import urlparse, parse_qs
 
 try:
@@ -25,21 +28,75 @@ try:
 except ImportError:
     HAS_RICH = False
 
-try:
-    from colorama import Fore, Style, init
 
-    init(autoreset=True)  # Initialize colorama
-    HAS_COLOR = True
-except ImportError:
-    # Fallback if colorama is not available
-    class _DummyColor:
-        def __getattr__(self, name):
-            return ""
+# Fallback used until colorama is loaded, or if it is not available
+_EMPTY_COLORS = types.SimpleNamespace(
+    **{
+        name: ""
+        for name in (
+            "RED",
+            "GREEN",
+            "YELLOW",
+            "BLUE",
+            "CYAN",
+            "WHITE",
+            "MAGENTA",
+            "RESET_ALL",
+            "BRIGHT",
+        )
+    }
+)
+
+Fore = Style = _EMPTY_COLORS
+HAS_COLOR = False
+_color_inited = False
+
+# ANSI codes resolved by print_colored, keyed by color name
+_color_codes: Dict[str, str] = {}
+
+# (prefix, suffix) wrapped around status messages; colored once colorama loads
+_STATUS_FORMATS: Dict[str, Tuple[str, str]] = {
+    "success": ("✓ ", "\n"),
+    "error": ("✗ ", "\n"),
+    "warning": ("⚠ ", "\n"),
+    "info": ("ℹ ", "\n"),
+}
+
+
+def _get_color() -> Tuple[Any, Any]:
+    """
+    Import and initialize colorama on first use, returning (Fore, Style).
+
+    Colors stay disabled when stdout is not a terminal or NO_COLOR is set, which
+    also skips colorama's stream wrapping for piped output.
+    """
+    global Fore, Style, HAS_COLOR, _color_inited
+    if not _color_inited:
+        _color_inited = True
+        if os.environ.get("NO_COLOR") or not sys.stdout.isatty():
+            return Fore, Style
+        try:
+            import colorama
+
+            colorama.init(autoreset=True)
+            Fore, Style = colorama.Fore, colorama.Style
+            HAS_COLOR = True
+            reset = f"{Style.RESET_ALL}\n"
+            _STATUS_FORMATS.update(
+                success=(f"{Style.BRIGHT}{Fore.GREEN}✓ ", reset),
+                error=(f"{Style.BRIGHT}{Fore.RED}✗ ", reset),
+                warning=(f"{Style.BRIGHT}{Fore.YELLOW}⚠ ", reset),
+                info=(f"{Fore.BLUE}ℹ ", reset),
+            )
+        except ImportError:
+            pass
+    return Fore, Style
 
-    Fore = Style = _DummyColor()
-    HAS_COLOR = False
 
-from .core import GitHubOAuth, GitHubOAuthError
+# The core module (and requests) is imported lazily by the command handlers so
+# that --help and argument errors do not pay for it.
+if TYPE_CHECKING:
+    from .core import GitHubOAuth
 
 # Initialize Rich console
 console = Console() if HAS_RICH else None
@@ -117,6 +174,7 @@ def show_header() -> None:
 
     else:
         # Fallback ASCII art for terminals without Rich
+        Fore, Style = _get_color()
         header_text = f"""
 {Fore.CYAN}{Style.BRIGHT}
  ██████╗ ██╗  ██╗      ██████╗  █████╗ ██╗   ██╗████████╗██╗  ██╗
@@ -211,8 +269,130 @@ def display_code_block(code: str, language: str = "bash") -> None:
         print_colored(f"\n{code}", "white")
 
 
-def create_parser() -> argparse.ArgumentParser:
-    """Create and configure the argument parser."""
+# Default OAuth scopes for the auth command, shared by every parser build
+DEFAULT_SCOPES = ("user:email", "repo")
+DEFAULT_SCOPES_JOINED = ", ".join(DEFAULT_SCOPES)
+
+
+def _add_auth_parser(subparsers: Any) -> None:
+    """Add the auth command - generate authorization URL."""
+    auth_parser = subparsers.add_parser(
+        "auth", help="Generate GitHub OAuth authorization URL"
+    )
+    auth_parser.add_argument(
+        "--scopes",
+        nargs="*",
+        default=DEFAULT_SCOPES,
+        help="OAuth scopes to request (default: user:email repo)",
+    )
+    auth_parser.add_argument(
+        "--state", help="Custom state parameter (random generated if not provided)"
+    )
+    auth_parser.add_argument(
+        "--open",
+        action="store_true",
+        help="Automatically open the authorization URL in browser",
+    )
+
+
+def _add_token_parser(subparsers: Any) -> None:
+    """Add the token command - exchange code for token."""
+    token_parser = subparsers.add_parser(
+        "token", help="Exchange authorization code for access token"
+    )
+
+    # Create mutually exclusive group for code input methods
+    code_group = token_parser.add_mutually_exclusive_group(required=True)
+    code_group.add_argument("--code", help="Authorization code from GitHub callback")
+    code_group.add_argument(
+        "--url",
+        help="Full callback URL from GitHub (will extract code and state automatically)",
+    )
+
+    token_parser.add_argument(
+        "--state",
+        help="State parameter for CSRF verification (not needed if using --url)",
+    )
+
+
+def _add_test_parser(subparsers: Any) -> None:
+    """Add the test command - test token validity."""
+    test_parser = subparsers.add_parser("test", help="Test access token validity")
+    test_parser.add_argument("--token", required=True, help="Access token to test")
+
+
+def _add_revoke_parser(subparsers: Any) -> None:
+    """Add the revoke command - revoke access token."""
+    revoke_parser = subparsers.add_parser("revoke", help="Revoke access token")
+    revoke_parser.add_argument("--token", required=True, help="Access token to revoke")
+
+
+def _add_batch_parser(subparsers: Any) -> None:
+    """Add the batch command - run several commands in one process."""
+    batch_parser = subparsers.add_parser(
+        "batch", help="Run a JSON list of commands in a single process"
+    )
+    batch_parser.add_argument(
+        "--file",
+        required=True,
+        help=(
+            'JSON file with a list of commands, e.g. [{"command": "auth"}] '
+            '("-" for stdin)'
+        ),
+    )
+
+
+# Subcommand parser builders, in help display order
+SUBCOMMAND_BUILDERS = {
+    "auth": _add_auth_parser,
+    "token": _add_token_parser,
+    "test": _add_test_parser,
+    "revoke": _add_revoke_parser,
+    "batch": _add_batch_parser,
+}
+
+# Global options that consume the following argument as their value
+GLOBAL_VALUE_OPTIONS = ("--client-id", "--client-secret", "--redirect-uri")
+
+# Global options that take no value
+GLOBAL_FLAG_OPTIONS = ("--secure", "--json", "--verbose", "-v", "--no-header")
+
+
+def find_command(argv: List[str]) -> Optional[str]:
+    """
+    Find the subcommand in ``argv`` without building a parser.
+
+    Returns None when no known command is found, help is requested before it,
+    an option it does not recognize (such as an abbreviation argparse would
+    accept) comes before it, or worker mode is requested (the worker serves
+    every command). The full parser should be used in those cases.
+    """
+    if "--worker" in argv:
+        return None
+
+    skip_value = False
+    for arg in argv:
+        if skip_value:
+            skip_value = False
+        elif arg in GLOBAL_VALUE_OPTIONS:
+            skip_value = True
+        elif arg.startswith("-"):
+            if arg not in GLOBAL_FLAG_OPTIONS and (
+                arg.split("=", 1)[0] not in GLOBAL_VALUE_OPTIONS
+            ):
+                return None
+        else:
+            return arg if arg in SUBCOMMAND_BUILDERS else None
+    return None
+
+
+def create_parser(command: Optional[str] = None) -> argparse.ArgumentParser:
+    """
+    Create and configure the argument parser.
+
+    If ``command`` is given, only that subcommand's parser is built, which keeps
+    startup cheap when the command is already known.
+    """
     parser = argparse.ArgumentParser(
         prog="gh-oauth-helper",
         description="GitHub OAuth Helper - Manage GitHub OAuth authentication flows",
@@ -234,6 +414,9 @@ Examples:
   # Revoke token
   gh-oauth-helper revoke --client-id YOUR_ID --client-secret YOUR_SECRET --token ACCESS_TOKEN
 
+  # Run several commands from a JSON file in one process
+  gh-oauth-helper --client-id YOUR_ID --client-secret YOUR_SECRET batch --file cmds.json
+
 Environment Variables:
   GITHUB_CLIENT_ID      - GitHub OAuth app client ID
   GITHUB_CLIENT_SECRET  - GitHub OAuth app client secret
@@ -268,54 +451,17 @@ Environment Variables:
     parser.add_argument(
         "--no-header", action="store_true", help="Disable ASCII art header display"
     )
-
-    # Subcommands
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
-
-    # Auth command - generate authorization URL
-    auth_parser = subparsers.add_parser(
-        "auth", help="Generate GitHub OAuth authorization URL"
-    )
-    auth_parser.add_argument(
-        "--scopes",
-        nargs="*",
-        default=["user:email", "repo"],
-        help="OAuth scopes to request (default: user:email repo)",
-    )
-    auth_parser.add_argument(
-        "--state", help="Custom state parameter (random generated if not provided)"
-    )
-    auth_parser.add_argument(
-        "--open",
+    parser.add_argument(
+        "--worker",
         action="store_true",
-        help="Automatically open the authorization URL in browser",
-    )
-
-    # Token command - exchange code for token
-    token_parser = subparsers.add_parser(
-        "token", help="Exchange authorization code for access token"
-    )
-
-    # Create mutually exclusive group for code input methods
-    code_group = token_parser.add_mutually_exclusive_group(required=True)
-    code_group.add_argument("--code", help="Authorization code from GitHub callback")
-    code_group.add_argument(
-        "--url",
-        help="Full callback URL from GitHub (will extract code and state automatically)",
-    )
-
-    token_parser.add_argument(
-        "--state",
-        help="State parameter for CSRF verification (not needed if using --url)",
+        help="Serve commands read from stdin as JSON lines (for scripting)",
     )
 
-    # Test command - test token validity
-    test_parser = subparsers.add_parser("test", help="Test access token validity")
-    test_parser.add_argument("--token", required=True, help="Access token to test")
-
-    # Revoke command - revoke access token
-    revoke_parser = subparsers.add_parser("revoke", help="Revoke access token")
-    revoke_parser.add_argument("--token", required=True, help="Access token to revoke")
+    # Subcommands
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+    for name, add_subparser in SUBCOMMAND_BUILDERS.items():
+        if command is None or name == command:
+            add_subparser(subparsers)
 
     return parser
 
@@ -329,36 +475,94 @@ def validate_args(args: argparse.Namespace) -> None:
 
 def print_colored(text: str, color: str = "", bold: bool = False) -> None:
     """Print colored text if colors are available."""
+    if not _color_inited:
+        _get_color()
     if HAS_COLOR:
         style = Style.BRIGHT if bold else ""
-        color_code = getattr(Fore, color.upper(), "") if color else ""
+        color_code = _color_codes.get(color)
+        if color_code is None:
+            color_code = getattr(Fore, color.upper(), "") if color else ""
+            _color_codes[color] = color_code
         print(f"{style}{color_code}{text}{Style.RESET_ALL}")
     else:
         print(text)
 
 
+def _print_status(kind: str, text: str) -> None:
+    """Write a status message using its precomputed prefix and suffix."""
+    if not _color_inited:
+        _get_color()
+    prefix, suffix = _STATUS_FORMATS[kind]
+    sys.stdout.write(prefix + text + suffix)
+
+
 def print_success(text: str) -> None:
     """Print success message in green."""
-    print_colored(f"✓ {text}", "green", bold=True)
+    _print_status("success", text)
 
 
 def print_error(text: str) -> None:
     """Print error message in red."""
-    print_colored(f"✗ {text}", "red", bold=True)
+    _print_status("error", text)
 
 
 def print_warning(text: str) -> None:
     """Print warning message in yellow."""
-    print_colored(f"⚠ {text}", "yellow", bold=True)
+    _print_status("warning", text)
 
 
 def print_info(text: str) -> None:
     """Print info message in blue."""
-    print_colored(f"ℹ {text}", "blue")
+    _print_status("info", text)
 
 
-def create_oauth_helper(args: argparse.Namespace) -> GitHubOAuth:
+# Environment lookups are cached: the CLI's environment is fixed at startup, so
+# changes made after the first read are deliberately not picked up.
+@functools.lru_cache(maxsize=None)
+def _env_client_id() -> Optional[str]:
+    """Return GITHUB_CLIENT_ID from the environment (cached)."""
+    return os.getenv("GITHUB_CLIENT_ID")
+
+
+@functools.lru_cache(maxsize=None)
+def _env_client_secret() -> Optional[str]:
+    """Return GITHUB_CLIENT_SECRET from the environment (cached)."""
+    return os.getenv("GITHUB_CLIENT_SECRET")
+
+
+@functools.lru_cache(maxsize=None)
+def _env_redirect_uri() -> Optional[str]:
+    """Return GITHUB_REDIRECT_URI from the environment (cached)."""
+    return os.getenv("GITHUB_REDIRECT_URI")
+
+
+@functools.lru_cache(maxsize=4)
+def _get_oauth(
+    client_id: Optional[str],
+    client_secret: Optional[str],
+    redirect_uri: Optional[str],
+    secure: bool,
+) -> "GitHubOAuth":
+    """
+    Return a GitHubOAuth helper for the given settings, reused across commands.
+
+    Batch and worker runs thereby share one requests session (and its pooled
+    connections) for every command using the same credentials.
+    """
+    from .core import GitHubOAuth
+
+    return GitHubOAuth(
+        client_id=client_id,
+        client_secret=client_secret,
+        redirect_uri=redirect_uri,
+        secure_mode=secure,
+    )
+
+
+def create_oauth_helper(args: argparse.Namespace) -> "GitHubOAuth":
     """Create GitHubOAuth instance from command-line arguments."""
+    from .core import GitHubOAuthError
+
     redirect_uri = args.redirect_uri
 
     # Apply secure mode validation
@@ -372,18 +576,44 @@ def create_oauth_helper(args: argparse.Namespace) -> GitHubOAuth:
         else:
             print_info("Running in standard mode (HTTP allowed for localhost)")
 
-    return GitHubOAuth(
-        client_id=args.client_id,
-        client_secret=args.client_secret,
-        redirect_uri=redirect_uri,
-        secure_mode=args.secure,
+    return _get_oauth(
+        args.client_id or _env_client_id(),
+        args.client_secret or _env_client_secret(),
+        redirect_uri or _env_redirect_uri(),
+        args.secure,
     )
 
 
+@functools.lru_cache(maxsize=None)
+def _json_encoder() -> Callable[[Any], bytes]:
+    """Pick the JSON serializer once: orjson when installed, else the stdlib."""
+    try:
+        import orjson
+    except ImportError:
+        import json
+
+        return lambda obj: (json.dumps(obj, indent=2) + "\n").encode("utf-8")
+
+    option = orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+    return lambda obj: orjson.dumps(obj, option=option)
+
+
+def write_json(result: Any) -> None:
+    """Write result to stdout as indented JSON."""
+    data = _json_encoder()(result)
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is not None:
+        # Bypass text-mode encoding; flush pending text first to keep ordering
+        sys.stdout.flush()
+        buffer.write(data)
+    else:
+        sys.stdout.write(data.decode("utf-8"))
+
+
 def output_result(result: Any, args: argparse.Namespace) -> None:
     """Output result in requested format."""
     if args.json:
-        print(json.dumps(result, indent=2))
+        write_json(result)
     else:
         if isinstance(result, dict):
             for key, value in result.items():
@@ -394,6 +624,8 @@ def output_result(result: Any, args: argparse.Namespace) -> None:
 
 def cmd_auth(args: argparse.Namespace) -> None:
     """Handle auth command - generate authorization URL."""
+    from .core import GitHubOAuthError
+
     try:
         if args.verbose:
             print_rich_info("Initializing GitHub OAuth helper...")
@@ -412,7 +644,11 @@ def cmd_auth(args: argparse.Namespace) -> None:
 
             if args.verbose:
                 info_data = {
-                    "scopes_requested": ", ".join(args.scopes),
+                    "scopes_requested": (
+                        DEFAULT_SCOPES_JOINED
+                        if args.scopes is DEFAULT_SCOPES
+                        else ", ".join(args.scopes)
+                    ),
                     "state_parameter": state,
                     "redirect_uri": oauth.redirect_uri,
                 }
@@ -431,6 +667,8 @@ def cmd_auth(args: argparse.Namespace) -> None:
                 print_colored(f"State (save this for verification): {state}", "yellow")
 
             if args.open:
+                import webbrowser
+
                 print_rich_info("Opening authorization URL in browser...")
                 try:
                     webbrowser.open(auth_url)
@@ -456,6 +694,8 @@ def cmd_auth(args: argparse.Namespace) -> None:
 
 def cmd_token(args: argparse.Namespace) -> None:
     """Handle token command - exchange code for token."""
+    from .core import GitHubOAuthError
+
     try:
         if args.verbose:
             print_rich_info("Exchanging authorization code for access token...")
@@ -549,6 +789,8 @@ def cmd_token(args: argparse.Namespace) -> None:
 
 def cmd_test(args: argparse.Namespace) -> None:
     """Handle test command - test token validity."""
+    from .core import GitHubOAuthError
+
     try:
         if args.verbose:
             print_rich_info("Testing access token validity...")
@@ -599,6 +841,8 @@ def cmd_test(args: argparse.Namespace) -> None:
 
 def cmd_revoke(args: argparse.Namespace) -> None:
     """Handle revoke command - revoke access token."""
+    from .core import GitHubOAuthError
+
     try:
         if args.verbose:
             print_rich_info("Revoking access token...")
@@ -635,18 +879,170 @@ def cmd_revoke(args: argparse.Namespace) -> None:
         sys.exit(1)
 
 
-def main() -> None:
-    """Main CLI entry point."""
+# Global options that batch commands inherit from the batch invocation
+BATCH_GLOBAL_OPTIONS = ("client_id", "client_secret", "redirect_uri", "secure")
+
+
+# Options each command accepts in a batch descriptor; `open` is left out
+# because batch output is always JSON
+BATCH_COMMAND_OPTIONS = {
+    "auth": ("scopes", "state"),
+    "token": ("code", "url", "state"),
+    "test": ("token",),
+    "revoke": ("token",),
+}
+
+
+def capture_command(func: Callable[[], None]) -> Tuple[int, str, str]:
+    """
+    Run a command callable, returning its exit code, stdout and stderr.
+
+    The command sees an empty stdin so it cannot consume input meant for the
+    caller, such as queued worker requests. Unexpected exceptions are reported
+    as exit code 1 with their traceback on stderr instead of propagating.
+    """
+    stdout, stderr = io.StringIO(), io.StringIO()
+    returncode = 0
+    original_stdin = sys.stdin
+    sys.stdin = io.StringIO()
+    try:
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            try:
+                func()
+            except SystemExit as e:
+                if e.code is None:
+                    returncode = 0
+                else:
+                    returncode = e.code if isinstance(e.code, int) else 1
+            except Exception:
+                import traceback
+
+                sys.stderr.write(traceback.format_exc())
+                returncode = 1
+    finally:
+        sys.stdin = original_stdin
+    return returncode, stdout.getvalue(), stderr.getvalue()
+
+
+def build_batch_argv(command: Dict[str, Any]) -> List[str]:
+    """
+    Translate a batch command descriptor into subcommand arguments.
+
+    Raises:
+        ValueError: If the descriptor has options its command does not support.
+    """
+    allowed = BATCH_COMMAND_OPTIONS[command["command"]]
+    unsupported = sorted(
+        key for key in command if key != "command" and key not in allowed
+    )
+    if unsupported:
+        raise ValueError(
+            f"unsupported option(s) for {command['command']}: "
+            f"{', '.join(unsupported)} (supported: {', '.join(allowed)})"
+        )
+
+    argv = [str(command["command"])]
+    for key, value in command.items():
+        if key == "command" or value is None or value is False:
+            continue
+        flag = "--" + key.replace("_", "-")
+        if value is True:
+            argv.append(flag)
+        elif isinstance(value, list):
+            argv.append(flag)
+            argv.extend(str(item) for item in value)
+        else:
+            argv.extend([flag, str(value)])
+    return argv
+
+
+def cmd_batch(args: argparse.Namespace) -> None:
+    """Handle batch command - run a list of commands in one process."""
+    import json
+
+    try:
+        if args.file == "-":
+            commands = json.load(sys.stdin)
+        else:
+            with open(args.file, encoding="utf-8") as f:
+                commands = json.load(f)
+        if not isinstance(commands, list) or not all(
+            isinstance(command, dict)
+            and isinstance(command.get("command"), str)
+            and command["command"] in COMMAND_HANDLERS
+            for command in commands
+        ):
+            raise ValueError(
+                "batch file must contain a list of objects with a 'command' of "
+                + ", ".join(COMMAND_HANDLERS)
+            )
+    except (OSError, ValueError) as e:
+        write_json(
+            [
+                {
+                    "command": "batch",
+                    "returncode": 1,
+                    "error": f"Invalid batch file: {e}",
+                }
+            ]
+        )
+        sys.exit(1)
+
     parser = create_parser()
-    args = parser.parse_args()
+    results = []
+
+    for command in commands:
+
+        def run() -> None:
+            try:
+                item_argv = build_batch_argv(command)
+            except ValueError as e:
+                print(f"Error: {e}", file=sys.stderr)
+                sys.exit(2)
+            item_args = parser.parse_args(item_argv)
+            for option in BATCH_GLOBAL_OPTIONS:
+                setattr(item_args, option, getattr(args, option))
+            item_args.json = True
+            try:
+                validate_args(item_args)
+            except ValueError as e:
+                print_rich_error(f"Error: {e}")
+                sys.exit(1)
+            COMMAND_HANDLERS[command["command"]](item_args)
+
+        returncode, stdout, stderr = capture_command(run)
+        item: Dict[str, Any] = {"command": command["command"], "returncode": returncode}
+        if returncode == 0:
+            try:
+                item["result"] = json.loads(stdout)
+            except ValueError:
+                item["result"] = stdout.strip()
+        else:
+            item["error"] = (stdout + stderr).strip()
+        results.append(item)
 
-    # Show help if no command specified
-    if not args.command:
-        parser.print_help()
+    write_json(results)
+    if any(item["returncode"] for item in results):
         sys.exit(1)
 
+
+# Dispatch table for the single-shot commands
+COMMAND_HANDLERS = {
+    "auth": cmd_auth,
+    "token": cmd_token,
+    "test": cmd_test,
+    "revoke": cmd_revoke,
+}
+
+
+def dispatch(args: argparse.Namespace) -> None:
+    """Validate parsed arguments and run the matching command handler."""
     # Show header unless disabled or JSON output
-    if not getattr(args, "no_header", False) and not getattr(args, "json", False):
+    if (
+        not getattr(args, "no_header", False)
+        and not getattr(args, "json", False)
+        and args.command != "batch"
+    ):
         show_header()
 
     try:
@@ -656,12 +1052,7 @@ def main() -> None:
         sys.exit(1)
 
     # Dispatch to command handlers
-    command_handlers = {
-        "auth": cmd_auth,
-        "token": cmd_token,
-        "test": cmd_test,
-        "revoke": cmd_revoke,
-    }
+    command_handlers = dict(COMMAND_HANDLERS, batch=cmd_batch)
 
     handler = command_handlers.get(args.command)
     if handler:
@@ -671,5 +1062,77 @@ def main() -> None:
         sys.exit(1)
 
 
+# Global options given when starting a worker that apply to every request
+WORKER_GLOBAL_OPTIONS = BATCH_GLOBAL_OPTIONS + ("json", "verbose", "no_header")
+
+
+def run_worker(
+    parser: argparse.ArgumentParser, defaults: Optional[argparse.Namespace] = None
+) -> None:
+    """
+    Serve CLI commands from stdin until EOF.
+
+    Each input line is a JSON array of CLI arguments, e.g.
+    ``["--json", "auth", "--scopes", "user"]``. For every line a single JSON
+    object with ``returncode``, ``stdout`` and ``stderr`` is written back, so
+    callers pay interpreter startup once instead of once per command.
+
+    Global options set in ``defaults`` (the worker's own arguments) apply to
+    every request that does not set them itself.
+    """
+    import json
+
+    worker_defaults = {
+        option: getattr(defaults, option)
+        for option in WORKER_GLOBAL_OPTIONS
+        if defaults is not None and getattr(defaults, option, None)
+    }
+
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+
+        def run() -> None:
+            try:
+                argv = json.loads(line)
+                if not isinstance(argv, list):
+                    raise ValueError("expected a JSON array of arguments")
+            except ValueError as e:
+                print(f"Error: invalid worker request: {e}", file=sys.stderr)
+                sys.exit(2)
+            # argparse only fills in defaults for attributes not already set
+            args = parser.parse_args(
+                [str(arg) for arg in argv], argparse.Namespace(**worker_defaults)
+            )
+            if not args.command:
+                parser.print_help()
+                sys.exit(1)
+            dispatch(args)
+
+        returncode, stdout, stderr = capture_command(run)
+        result = {"returncode": returncode, "stdout": stdout, "stderr": stderr}
+        sys.stdout.write(json.dumps(result) + "\n")
+        sys.stdout.flush()
+
+
+def main() -> None:
+    """Main CLI entry point."""
+    argv = sys.argv[1:]
+    parser = create_parser(find_command(argv))
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        run_worker(parser, args)
+        return
+
+    # Show help if no command specified
+    if not args.command:
+        parser.print_help()
+        sys.exit(1)
+
+    dispatch(args)
+
+
 if __name__ == "__main__":
     main()
@@ -109,6 +109,9 @@ class GitHubOAuth:
         # Configure transport security based on redirect URI and secure mode
         _configure_transport_security(self.redirect_uri, self.secure_mode)
 
+        # Persistent session so repeated calls reuse pooled keep-alive connections
+        self.session = requests.Session()
+
     def generate_authorization_url(
         self, scopes: Optional[list] = None, state: Optional[str] = None
     ) -> Tuple[str, str]:
@@ -165,7 +168,7 @@ class GitHubOAuth:
         headers = {"Accept": "application/json", "User-Agent": "gh-oauth-helper/1.0"}
 
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.TOKEN_URL, data=data, headers=headers, timeout=30
             )
             response.raise_for_status()
@@ -211,7 +214,7 @@ class GitHubOAuth:
         }
 
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.API_BASE_URL}/user", headers=headers, timeout=30
             )
             response.raise_for_status()
@@ -245,7 +248,7 @@ class GitHubOAuth:
         }
 
         try:
-            response = requests.delete(
+            response = self.session.delete(
                 f"{self.API_BASE_URL}/applications/{self.client_id}/token",
                 headers=headers,
                 json={"access_token": access_token},
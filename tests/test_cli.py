@@ -0,0 +1,603 @@
+"""
+Tests for the command-line interface.
+"""
+
+import io
+import json
+import os
+import sys
+import types
+from unittest.mock import patch
+
+import pytest
+
+from gh_oauth_helper import cli
+
+EXAMPLES_DIR = os.path.join(os.path.dirname(__file__), "..", "examples")
+SRC_DIR = os.path.join(os.path.dirname(__file__), "..", "src")
+
+CREDENTIALS = ["--client-id", "test_client_id", "--client-secret", "test_secret"]
+
+
+@pytest.fixture(autouse=True)
+def clear_cli_caches():
+    """Keep cached environment reads and helpers from leaking between tests."""
+    caches = (
+        cli._env_client_id,
+        cli._env_client_secret,
+        cli._env_redirect_uri,
+        cli._get_oauth,
+    )
+    for cache in caches:
+        cache.cache_clear()
+    yield
+    for cache in caches:
+        cache.cache_clear()
+
+
+def run_worker_lines(lines, argv=()):
+    """Feed request lines to run_worker and return the decoded responses."""
+    parser = cli.create_parser()
+    defaults = parser.parse_args(["--worker", *argv])
+    stdin = io.StringIO("".join(line + "\n" for line in lines))
+    stdout = io.StringIO()
+    with patch.object(sys, "stdin", stdin), patch.object(sys, "stdout", stdout):
+        cli.run_worker(parser, defaults)
+    return [json.loads(line) for line in stdout.getvalue().splitlines()]
+
+
+class TestWorker:
+    """Test cases for the --worker stdin/stdout protocol."""
+
+    def test_response_shape(self):
+        """Test that each request yields one JSON object with the command output."""
+        request = json.dumps(["--json", *CREDENTIALS, "auth", "--state", "abc"])
+        (response,) = run_worker_lines([request])
+
+        assert set(response) == {"returncode", "stdout", "stderr"}
+        assert response["returncode"] == 0
+        assert response["stderr"] == ""
+        result = json.loads(response["stdout"])
+        assert result["state"] == "abc"
+        assert result["scopes"] == ["user:email", "repo"]
+
+    def test_returncode_propagation(self):
+        """Test that argparse errors report their exit status."""
+        responses = run_worker_lines(
+            [json.dumps(["test"]), json.dumps(["--json", *CREDENTIALS, "auth"])]
+        )
+
+        assert responses[0]["returncode"] == 2
+        assert "required: --token" in responses[0]["stderr"]
+        assert responses[1]["returncode"] == 0
+
+    def test_invalid_json_line(self):
+        """Test that malformed requests are reported without stopping the worker."""
+        responses = run_worker_lines(
+            ["not json", json.dumps({"command": "auth"}), json.dumps(["--help"])]
+        )
+
+        assert [r["returncode"] for r in responses] == [2, 2, 0]
+        assert "invalid worker request" in responses[0]["stderr"]
+        assert "expected a JSON array" in responses[1]["stderr"]
+
+    def test_help_inside_worker(self):
+        """Test that --help prints usage and succeeds."""
+        (response,) = run_worker_lines([json.dumps(["--help"])])
+
+        assert response["returncode"] == 0
+        assert "usage: gh-oauth-helper" in response["stdout"]
+
+    def test_unexpected_error_keeps_worker_alive(self):
+        """Test that a request raising an exception still gets a response."""
+        nested = "[" * 100000 + "]" * 100000
+        responses = run_worker_lines(
+            [nested, json.dumps(["--json", *CREDENTIALS, "auth", "--state", "abc"])]
+        )
+
+        assert len(responses) == 2
+        assert responses[0]["returncode"] == 1
+        assert "RecursionError" in responses[0]["stderr"]
+        assert json.loads(responses[1]["stdout"])["state"] == "abc"
+
+    def test_blank_lines_skipped(self):
+        """Test that empty lines do not produce responses."""
+        assert run_worker_lines(["", "   "]) == []
+
+    def test_worker_global_options_are_defaults(self):
+        """Test that options given when starting the worker apply to requests."""
+        (response,) = run_worker_lines(
+            [json.dumps(["auth", "--state", "abc"])], argv=["--json", *CREDENTIALS]
+        )
+
+        assert response["returncode"] == 0
+        result = json.loads(response["stdout"])
+        assert "client_id=test_client_id" in result["authorization_url"]
+
+    def test_request_overrides_worker_options(self):
+        """Test that a request's own options win over worker defaults."""
+        request = json.dumps(["--client-id", "other_id", "auth"])
+        (response,) = run_worker_lines([request], argv=["--json", *CREDENTIALS])
+
+        result = json.loads(response["stdout"])
+        assert "client_id=other_id" in result["authorization_url"]
+
+
+class TestCaptureCommand:
+    """Test cases for capture_command."""
+
+    def test_bare_exit_is_success(self):
+        """Test that sys.exit() without a code reports success."""
+        assert cli.capture_command(sys.exit) == (0, "", "")
+
+    def test_exit_codes(self):
+        """Test integer and non-integer exit codes."""
+
+        def fail():
+            print("out")
+            sys.exit(3)
+
+        assert cli.capture_command(fail) == (3, "out\n", "")
+        assert cli.capture_command(lambda: sys.exit("boom"))[0] == 1
+
+    def test_unexpected_exception(self):
+        """Test that other exceptions are reported instead of propagating."""
+
+        def crash():
+            raise RuntimeError("boom")
+
+        returncode, stdout, stderr = cli.capture_command(crash)
+
+        assert returncode == 1
+        assert stdout == ""
+        assert "Traceback" in stderr
+        assert "RuntimeError: boom" in stderr
+
+
+class TestCliExample:
+    """Test cases for examples/cli_example.run_cli_command."""
+
+    @pytest.fixture
+    def cli_example(self, monkeypatch):
+        """Import the example with the worker able to find the package."""
+        pythonpath = os.environ.get("PYTHONPATH")
+        monkeypatch.setenv(
+            "PYTHONPATH",
+            os.pathsep.join(p for p in (os.path.abspath(SRC_DIR), pythonpath) if p),
+        )
+        monkeypatch.syspath_prepend(EXAMPLES_DIR)
+        import cli_example
+
+        yield cli_example
+
+        if cli_example._worker is not None:
+            cli_example._worker.stdin.close()
+            cli_example._worker.wait(timeout=10)
+            cli_example._worker = None
+
+    def test_run_cli_command(self, cli_example):
+        """Test that commands run in one persistent worker."""
+        output = cli_example.run_cli_command(
+            ["--json", *CREDENTIALS, "auth", "--state", "abc"]
+        )
+        worker = cli_example._worker
+
+        assert json.loads(output)["state"] == "abc"
+        assert cli_example.run_cli_command(["--help"]) is not None
+        assert cli_example._worker is worker
+
+    def test_run_cli_command_error(self, cli_example, capsys):
+        """Test that failing commands return None and report stderr."""
+        assert cli_example.run_cli_command(["--no-header", "test"]) is None
+        assert "required: --token" in capsys.readouterr().out
+
+
+def run_batch(commands, tmp_path, argv=CREDENTIALS):
+    """Run the batch command on a JSON file and return (exit code, results)."""
+    batch_file = tmp_path / "commands.json"
+    batch_file.write_text(
+        commands if isinstance(commands, str) else json.dumps(commands)
+    )
+    parser = cli.create_parser("batch")
+    args = parser.parse_args([*argv, "batch", "--file", str(batch_file)])
+    returncode, stdout, _ = cli.capture_command(lambda: cli.cmd_batch(args))
+    return returncode, json.loads(stdout)
+
+
+class TestBuildBatchArgv:
+    """Test cases for build_batch_argv."""
+
+    def test_translates_options(self):
+        """Test that descriptor keys become subcommand arguments."""
+        argv = cli.build_batch_argv(
+            {"command": "auth", "scopes": ["user", "repo"], "state": "abc"}
+        )
+        assert argv == ["auth", "--scopes", "user", "repo", "--state", "abc"]
+
+    def test_skips_unset_values(self):
+        """Test that None values are left out."""
+        argv = cli.build_batch_argv({"command": "token", "code": "c", "state": None})
+        assert argv == ["token", "--code", "c"]
+
+    @pytest.mark.parametrize(
+        "command",
+        [
+            {"command": "auth", "verbose": True},
+            {"command": "auth", "open": True},
+            {"command": "test", "token": "t", "scopes": ["user"]},
+        ],
+    )
+    def test_rejects_unsupported_options(self, command):
+        """Test that options the command does not take are rejected."""
+        with pytest.raises(ValueError, match="unsupported option"):
+            cli.build_batch_argv(command)
+
+
+class TestBatch:
+    """Test cases for the batch command."""
+
+    @patch("gh_oauth_helper.core.requests.Session.delete")
+    def test_runs_commands(self, mock_delete, tmp_path):
+        """Test that results are collected into one JSON array."""
+        mock_delete.return_value.status_code = 204
+        returncode, results = run_batch(
+            [
+                {"command": "auth", "scopes": ["user"], "state": "abc"},
+                {"command": "revoke", "token": "t"},
+            ],
+            tmp_path,
+        )
+
+        assert returncode == 0
+        assert [r["command"] for r in results] == ["auth", "revoke"]
+        assert results[0]["result"]["state"] == "abc"
+        assert results[1]["result"] == {"revoked": True}
+
+    def test_failed_command(self, tmp_path):
+        """Test that failing commands carry an error and fail the batch."""
+        returncode, results = run_batch(
+            [{"command": "auth", "state": "abc"}, {"command": "auth", "verbose": True}],
+            tmp_path,
+        )
+
+        assert returncode == 1
+        assert results[0]["returncode"] == 0
+        assert results[1]["returncode"] == 2
+        assert "unsupported option(s) for auth: verbose" in results[1]["error"]
+
+    @pytest.mark.parametrize(
+        "commands",
+        [
+            "not json",
+            "{}",
+            json.dumps([{"command": "nope"}]),
+            json.dumps([{"command": ["auth"]}]),
+            json.dumps([{"command": {"name": "auth"}}]),
+            json.dumps([{"scopes": ["user"]}]),
+        ],
+    )
+    def test_invalid_batch_file(self, commands, tmp_path):
+        """Test that invalid batch files are reported as JSON."""
+        returncode, results = run_batch(commands, tmp_path)
+
+        assert returncode == 1
+        assert results[0]["command"] == "batch"
+        assert results[0]["error"].startswith("Invalid batch file:")
+
+    def test_unhashable_command_in_worker(self, tmp_path):
+        """Test that a malformed descriptor does not stop the worker."""
+        batch_file = tmp_path / "commands.json"
+        batch_file.write_text(json.dumps([{"command": ["auth"]}]))
+        responses = run_worker_lines(
+            [
+                json.dumps(["batch", "--file", str(batch_file)]),
+                json.dumps(["--json", *CREDENTIALS, "auth", "--state", "abc"]),
+            ]
+        )
+
+        assert len(responses) == 2
+        assert responses[0]["returncode"] == 1
+        assert "Invalid batch file" in json.loads(responses[0]["stdout"])[0]["error"]
+        assert json.loads(responses[1]["stdout"])["state"] == "abc"
+
+    def test_batch_in_worker_does_not_consume_requests(self):
+        """Test that batch --file - inside the worker cannot read later requests."""
+        responses = run_worker_lines(
+            [
+                json.dumps(["batch", "--file", "-"]),
+                json.dumps(["--json", *CREDENTIALS, "auth", "--state", "abc"]),
+            ]
+        )
+
+        assert len(responses) == 2
+        assert responses[0]["returncode"] == 1
+        assert "Invalid batch file" in responses[0]["stdout"]
+        assert json.loads(responses[1]["stdout"])["state"] == "abc"
+
+
+class TestFindCommand:
+    """Test cases for find_command and create_parser."""
+
+    @pytest.mark.parametrize(
+        "argv, expected",
+        [
+            (["auth"], "auth"),
+            (["--json", "-v", "revoke", "--token", "t"], "revoke"),
+            (["--client-id", "test", "--client-secret", "s", "auth"], "auth"),
+            (["--redirect-uri", "http://localhost", "token", "--code", "c"], "token"),
+            (["--client-id=test", "test", "--token", "t"], "test"),
+            ([], None),
+            (["--json"], None),
+            (["-h", "auth"], None),
+            (["--help", "auth"], None),
+            (["--", "auth"], None),
+            (["bogus"], None),
+            (["--client", "x", "auth"], None),
+            (["--client-i", "test", "auth"], None),
+            (["--js", "auth"], None),
+            (["--secure", "--no-header", "auth"], "auth"),
+            (["--redirect-uri=https://example.com", "auth"], "auth"),
+            (["-vh", "auth"], None),
+            (["--worker"], None),
+            (["--worker", "auth"], None),
+            (["--json", "--worker", "--client-id", "x", "revoke"], None),
+        ],
+    )
+    def test_find_command(self, argv, expected):
+        """Test command detection across global option layouts."""
+        assert cli.find_command(argv) == expected
+
+    def test_abbreviated_option_uses_full_parser(self, monkeypatch):
+        """Test that abbreviations still parse as they do with the full parser."""
+        argv = ["--client-i", "test", "--client-secret", "s", "--json", "auth"]
+        monkeypatch.setattr(sys, "argv", ["gh-oauth-helper", *argv])
+        stdout = io.StringIO()
+        with patch.object(sys, "stdout", stdout):
+            cli.main()
+
+        result = json.loads(stdout.getvalue())
+        assert "client_id=test" in result["authorization_url"]
+
+    def test_create_parser_single_command(self):
+        """Test that only the requested subcommand is registered."""
+        parser = cli.create_parser("test")
+
+        args = parser.parse_args([*CREDENTIALS, "test", "--token", "t"])
+        assert args.command == "test"
+        assert args.client_id == "test_client_id"
+        assert args.token == "t"
+        with pytest.raises(SystemExit):
+            with patch.object(sys, "stderr", io.StringIO()):
+                parser.parse_args(["auth"])
+
+    def test_create_parser_all_commands(self):
+        """Test that the full parser knows every subcommand."""
+        parser = cli.create_parser()
+        argvs = {
+            "auth": ["auth"],
+            "token": ["token", "--code", "c"],
+            "test": ["test", "--token", "t"],
+            "revoke": ["revoke", "--token", "t"],
+            "batch": ["batch", "--file", "-"],
+        }
+
+        assert set(argvs) == set(cli.SUBCOMMAND_BUILDERS)
+        for command, argv in argvs.items():
+            assert parser.parse_args(argv).command == command
+
+
+class TestCreateOAuthHelper:
+    """Test cases for create_oauth_helper."""
+
+    def make_args(self, **overrides):
+        """Build parsed global arguments for an auth command."""
+        args = cli.create_parser("auth").parse_args([*CREDENTIALS, "auth"])
+        for key, value in overrides.items():
+            setattr(args, key, value)
+        return args
+
+    def test_reuses_helper_for_same_args(self):
+        """Test that identical settings share one helper and session."""
+        first = cli.create_oauth_helper(self.make_args())
+        second = cli.create_oauth_helper(self.make_args())
+
+        assert first is second
+        assert first.session is second.session
+
+    def test_new_helper_for_different_args(self):
+        """Test that different credentials get their own helper."""
+        first = cli.create_oauth_helper(self.make_args())
+        second = cli.create_oauth_helper(self.make_args(client_id="other_id"))
+
+        assert first is not second
+        assert second.client_id == "other_id"
+
+
+class TestWriteJson:
+    """Test cases for write_json."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """Re-select the serializer for each test."""
+        cli._json_encoder.cache_clear()
+        yield
+        cli._json_encoder.cache_clear()
+
+    @pytest.fixture
+    def fake_orjson(self):
+        """Install a stand-in orjson module that tags its output."""
+        module = types.SimpleNamespace(
+            OPT_INDENT_2=1,
+            OPT_APPEND_NEWLINE=2,
+            dumps=lambda obj, option: b"orjson:" + json.dumps(obj).encode() + b"\n",
+        )
+        with patch.dict(sys.modules, {"orjson": module}):
+            yield module
+
+    def write(self, stream, result):
+        """Write result to stream and return what was written."""
+        with patch.object(sys, "stdout", stream):
+            cli.write_json(result)
+        if isinstance(stream, io.TextIOWrapper):
+            stream.flush()
+            return stream.buffer.getvalue().decode("utf-8")
+        return stream.getvalue()
+
+    def test_stdlib_text_stream(self):
+        """Test the stdlib fallback on a stream without a buffer."""
+        with patch.dict(sys.modules, {"orjson": None}):
+            output = self.write(io.StringIO(), {"revoked": True})
+
+        assert output == '{\n  "revoked": true\n}\n'
+
+    def test_stdlib_binary_stream(self):
+        """Test the stdlib fallback writing to the underlying buffer."""
+        stream = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+        stream.write("before\n")
+        with patch.dict(sys.modules, {"orjson": None}):
+            output = self.write(stream, {"revoked": True})
+
+        assert output == 'before\n{\n  "revoked": true\n}\n'
+
+    def test_orjson_binary_stream(self, fake_orjson):
+        """Test that orjson output goes straight to the buffer."""
+        stream = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+        assert self.write(stream, [1]) == "orjson:[1]\n"
+
+    def test_orjson_text_stream(self, fake_orjson):
+        """Test that orjson output is decoded for streams without a buffer."""
+        assert self.write(io.StringIO(), [1]) == "orjson:[1]\n"
+
+    def test_serializer_selected_once(self):
+        """Test that a missing orjson is only looked up once."""
+        with patch.dict(sys.modules, {"orjson": None}):
+            first = cli._json_encoder()
+        assert cli._json_encoder() is first
+
+
+class TestColor:
+    """Test cases for lazy colorama initialization."""
+
+    @pytest.fixture(autouse=True)
+    def reset_color_state(self, monkeypatch):
+        """Start each test with colorama unloaded and uninitialized."""
+        monkeypatch.setattr(cli, "_color_inited", False)
+        monkeypatch.setattr(cli, "HAS_COLOR", False)
+        monkeypatch.setattr(cli, "Fore", cli._EMPTY_COLORS)
+        monkeypatch.setattr(cli, "Style", cli._EMPTY_COLORS)
+        monkeypatch.setattr(cli, "_color_codes", {})
+        monkeypatch.setattr(cli, "_STATUS_FORMATS", dict(cli._STATUS_FORMATS))
+        monkeypatch.delenv("NO_COLOR", raising=False)
+        monkeypatch.delitem(sys.modules, "colorama", raising=False)
+
+    def tty_stdout(self):
+        """Return a text stream that reports itself as a terminal."""
+        stream = io.StringIO()
+        stream.isatty = lambda: True
+        return stream
+
+    def test_non_tty_disables_color(self):
+        """Test that piped output leaves colors off and colorama unloaded."""
+        with patch.object(sys, "stdout", io.StringIO()):
+            cli.print_success("done")
+            output = sys.stdout.getvalue()
+
+        assert output == "✓ done\n"
+        assert cli.HAS_COLOR is False
+        assert "colorama" not in sys.modules
+
+    def test_no_color_disables_color(self, monkeypatch):
+        """Test that NO_COLOR wins even on a terminal."""
+        monkeypatch.setenv("NO_COLOR", "1")
+        with patch.object(sys, "stdout", self.tty_stdout()):
+            cli.print_colored("plain", "red", bold=True)
+            output = sys.stdout.getvalue()
+
+        assert output == "plain\n"
+        assert cli.HAS_COLOR is False
+        assert "colorama" not in sys.modules
+
+    def test_tty_enables_color(self):
+        """Test that a terminal without NO_COLOR loads colorama once."""
+        colorama = pytest.importorskip("colorama")
+        with patch.object(colorama, "init") as mock_init, patch.object(
+            sys, "stdout", self.tty_stdout()
+        ):
+            cli.print_success("done")
+            cli.print_colored("text", "red")
+
+        assert cli.HAS_COLOR is True
+        mock_init.assert_called_once_with(autoreset=True)
+        assert cli._STATUS_FORMATS["success"][0].endswith("✓ ")
+        assert cli._color_codes == {"red": colorama.Fore.RED}
+
+
+class TestEnvFallback:
+    """Test cases for the cached GITHUB_* environment fallback."""
+
+    @pytest.fixture
+    def github_env(self, monkeypatch):
+        """Provide OAuth app settings through the environment."""
+        monkeypatch.setenv("GITHUB_CLIENT_ID", "env_client_id")
+        monkeypatch.setenv("GITHUB_CLIENT_SECRET", "env_client_secret")
+        monkeypatch.setenv("GITHUB_REDIRECT_URI", "http://localhost:9000/callback")
+        return monkeypatch
+
+    def test_env_values_reach_helper(self, github_env):
+        """Test that unset options fall back to the environment."""
+        args = cli.create_parser("auth").parse_args(["auth"])
+        oauth = cli.create_oauth_helper(args)
+
+        assert oauth.client_id == "env_client_id"
+        assert oauth.client_secret == "env_client_secret"
+        assert oauth.redirect_uri == "http://localhost:9000/callback"
+
+    def test_options_override_env(self, github_env):
+        """Test that explicit options win over the environment."""
+        args = cli.create_parser("auth").parse_args([*CREDENTIALS, "auth"])
+        oauth = cli.create_oauth_helper(args)
+
+        assert oauth.client_id == "test_client_id"
+        assert oauth.client_secret == "test_secret"
+
+    def test_env_changes_after_first_read_ignored(self, github_env):
+        """Test that the environment is read once per process."""
+        args = cli.create_parser("auth").parse_args(["auth"])
+        assert cli.create_oauth_helper(args).client_id == "env_client_id"
+
+        github_env.setenv("GITHUB_CLIENT_ID", "changed_client_id")
+        github_env.setenv("GITHUB_CLIENT_SECRET", "changed_client_secret")
+        github_env.setenv("GITHUB_REDIRECT_URI", "http://localhost:9999/callback")
+        cli._get_oauth.cache_clear()
+        oauth = cli.create_oauth_helper(args)
+
+        assert oauth.client_id == "env_client_id"
+        assert oauth.client_secret == "env_client_secret"
+        assert oauth.redirect_uri == "http://localhost:9000/callback"
+
+
+class TestDefaultScopes:
+    """Test cases for the shared auth scopes default."""
+
+    def test_default_scopes(self):
+        """Test that the default is the shared tuple and serializes as a list."""
+        parser = cli.create_parser("auth")
+        args = parser.parse_args(["--json", *CREDENTIALS, "auth", "--state", "abc"])
+        assert args.scopes is cli.DEFAULT_SCOPES
+
+        returncode, stdout, _ = cli.capture_command(lambda: cli.cmd_auth(args))
+
+        assert returncode == 0
+        result = json.loads(stdout)
+        assert result["scopes"] == list(cli.DEFAULT_SCOPES)
+        assert "scope=user%3Aemail+repo" in result["authorization_url"]
+
+    def test_verbose_auth_lists_default_scopes(self):
+        """Test that verbose auth prints the precomputed scopes string."""
+        parser = cli.create_parser("auth")
+        args = parser.parse_args(["--verbose", *CREDENTIALS, "auth"])
+
+        returncode, stdout, _ = cli.capture_command(lambda: cli.cmd_auth(args))
+
+        assert returncode == 0
+        assert cli.DEFAULT_SCOPES_JOINED in stdout
@@ -55,6 +55,14 @@ class TestGitHubOAuth:
         with pytest.raises(GitHubOAuthError, match="GitHub client secret is required"):
             GitHubOAuth(client_id="client_id")
 
+    @patch("gh_oauth_helper.core.requests.Session")
+    def test_init_missing_credentials_creates_no_session(self, mock_session):
+        """Test that no session is created when validation fails."""
+        with pytest.raises(GitHubOAuthError):
+            GitHubOAuth(client_secret="secret")
+
+        mock_session.assert_not_called()
+
     def test_generate_authorization_url_default(self):
         """Test generating authorization URL with default parameters."""
         oauth = GitHubOAuth(
@@ -105,7 +113,7 @@ class TestGitHubOAuth:
         assert state == custom_state
         assert query_params["state"][0] == custom_state
 
-    @patch("gh_oauth_helper.core.requests.post")
+    @patch("gh_oauth_helper.core.requests.Session.post")
     def test_exchange_code_for_token_success(self, mock_post):
         """Test successful token exchange."""
         oauth = GitHubOAuth(
@@ -135,7 +143,7 @@ class TestGitHubOAuth:
         assert call_args[1]["data"]["client_secret"] == "test_client_secret"
         assert call_args[1]["data"]["code"] == "test_code"
 
-    @patch("gh_oauth_helper.core.requests.post")
+    @patch("gh_oauth_helper.core.requests.Session.post")
     def test_exchange_code_for_token_error_response(self, mock_post):
         """Test token exchange with error response."""
         oauth = GitHubOAuth(
@@ -154,7 +162,7 @@ class TestGitHubOAuth:
         with pytest.raises(GitHubOAuthError, match="Token exchange failed"):
             oauth.exchange_code_for_token("invalid_code")
 
-    @patch("gh_oauth_helper.core.requests.post")
+    @patch("gh_oauth_helper.core.requests.Session.post")
     def test_exchange_code_for_token_no_access_token(self, mock_post):
         """Test token exchange when no access token is returned."""
         oauth = GitHubOAuth(
@@ -170,7 +178,7 @@ class TestGitHubOAuth:
         with pytest.raises(GitHubOAuthError, match="No access token in response"):
             oauth.exchange_code_for_token("test_code")
 
-    @patch("gh_oauth_helper.core.requests.get")
+    @patch("gh_oauth_helper.core.requests.Session.get")
     def test_test_api_access_success(self, mock_get):
         """Test successful API access test."""
         oauth = GitHubOAuth(
@@ -199,7 +207,7 @@ class TestGitHubOAuth:
         assert call_args[0][0] == f"{oauth.API_BASE_URL}/user"
         assert call_args[1]["headers"]["Authorization"] == "Bearer test_access_token"
 
-    @patch("gh_oauth_helper.core.requests.get")
+    @patch("gh_oauth_helper.core.requests.Session.get")
     def test_test_api_access_invalid_token(self, mock_get):
         """Test API access test with invalid token."""
         oauth = GitHubOAuth(
@@ -215,7 +223,26 @@ class TestGitHubOAuth:
         with pytest.raises(GitHubOAuthError, match="Invalid or expired access token"):
             oauth.test_api_access("invalid_token")
 
-    @patch("gh_oauth_helper.core.requests.delete")
+    @patch("gh_oauth_helper.core.requests.Session.get")
+    def test_session_reused_across_requests(self, mock_get):
+        """Test that API calls share the instance's persistent session."""
+        oauth = GitHubOAuth(
+            client_id="test_client_id", client_secret="test_client_secret"
+        )
+        session = oauth.session
+
+        mock_response = Mock()
+        mock_response.json.return_value = {"login": "testuser"}
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+
+        oauth.test_api_access("test_access_token")
+        oauth.test_api_access("test_access_token")
+
+        assert oauth.session is session
+        assert mock_get.call_count == 2
+
+    @patch("gh_oauth_helper.core.requests.Session.delete")
     def test_revoke_token_success(self, mock_delete):
         """Test successful token revocation."""
         oauth = GitHubOAuth(
@@ -241,7 +268,7 @@ class TestGitHubOAuth:
             oauth.client_id}/token"
         )
 
-    @patch("gh_oauth_helper.core.requests.delete")
+    @patch("gh_oauth_helper.core.requests.Session.delete")
     def test_revoke_token_failure(self, mock_delete):
         """Test failed token revocation."""
         oauth = GitHubOAuth(
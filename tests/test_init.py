@@ -28,3 +28,22 @@ def test_package_import():
     import gh_oauth_helper
 
     assert gh_oauth_helper is not None
+
+
+def test_core_exports():
+    """Test that core classes/functions are exposed at package level."""
+    import gh_oauth_helper
+    from gh_oauth_helper import core
+
+    for name in ("GitHubOAuth", "GitHubOAuthError", "verify_token"):
+        assert getattr(gh_oauth_helper, name) is getattr(core, name)
+
+
+def test_core_exports_listed():
+    """Test that lazily loaded exports appear in dir()."""
+    import gh_oauth_helper
+
+    names = dir(gh_oauth_helper)
+    assert "GitHubOAuth" in names
+    assert "verify_token" in names
+    assert "__version__" in names